@@ -0,0 +1,21 @@
+@echo off
+echo Building mypyc extensions for ui_state / ui_scan...
+cd /d "%~dp0.."
+
+REM Check if mypyc is installed
+where mypyc >nul 2>nul
+if %ERRORLEVEL% NEQ 0 (
+    echo mypyc not installed. Run: pip install mypy
+    exit /b 1
+)
+
+REM Compile in place: src\ui_state.*.pyd and src\ui_scan.*.pyd shadow the .py files.
+REM src\ui_scan_kernels.py must stay interpreted: numba cannot JIT mypyc functions.
+mypyc --ignore-missing-imports --explicit-package-bases src\ui_state.py src\ui_scan.py
+if %ERRORLEVEL% NEQ 0 (
+    echo Build failed.
+    exit /b 1
+)
+
+if exist build rmdir /s /q build
+echo Built successfully! Delete src\ui_state.*.pyd and src\ui_scan.*.pyd to go back to pure Python.
@@ -1100,7 +1100,7 @@ def cmd_capture(title_contains, fps, duration_s, roi_path):
             "type": element.element_type,
             "label": element.label,
             "state": element.state,
-            "bounds": element.bounds,
+            "bounds": dict(zip(("x", "y", "width", "height"), element.bounds)),
         }
         for element in ui_elements
     ]
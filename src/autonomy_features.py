@@ -27,6 +27,12 @@ from enum import Enum
 from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
 logger = logging.getLogger(__name__)
 
 
@@ -1125,9 +1131,16 @@ class ResourceScanner:
         },
     }
 
+    # Below this many resources of a type the pure-Python loop beats NumPy
+    VECTOR_MIN_RESOURCES = 64
+
     def __init__(self):
         self.known_resources: Dict[str, Resource] = {}
         self.last_scan_time: float = 0.0
+        # Per-type (resources, positions) columns, rebuilt after each scan.
+        # Availability is read from the Resource objects, so callers may
+        # flip is_available directly without invalidating this.
+        self._index: Optional[Dict[str, Tuple[List[Resource], Any]]] = None
 
     def scan_area(
         self,
@@ -1170,6 +1183,7 @@ class ResourceScanner:
                     key = f"{res_type}_{resource.position}"
                     self.known_resources[key] = resource
 
+        self._index = None
         self.last_scan_time = time.time()
         return resources
 
@@ -1179,10 +1193,52 @@ class ResourceScanner:
         current_pos: Tuple[int, int],
     ) -> Optional[Resource]:
         """Get the nearest available resource of a given type."""
+        if not HAS_NUMPY:
+            return self._nearest_available_scalar(resource_type, current_pos)
+
+        if self._index is None:
+            by_type: Dict[str, List[Resource]] = {}
+            for resource in self.known_resources.values():
+                by_type.setdefault(resource.resource_type, []).append(resource)
+            self._index = {
+                res_type: (
+                    resources,
+                    np.array([r.position for r in resources], dtype=np.int64)
+                    if len(resources) >= self.VECTOR_MIN_RESOURCES else None,
+                )
+                for res_type, resources in by_type.items()
+            }
+
+        entry = self._index.get(resource_type)
+        if entry is None:
+            return None
+        resources, positions = entry
+        if positions is None:
+            return self._nearest_available_scalar(resource_type, current_pos, resources)
+
+        diffs = positions - np.asarray(current_pos, dtype=np.int64)
+        dist_sq = (diffs * diffs).sum(axis=1)
+        best = int(np.argmin(dist_sq))
+        if resources[best].is_available:
+            return resources[best]
+        for i in np.argsort(dist_sq, kind="stable"):
+            if resources[i].is_available:
+                return resources[i]
+        return None
+
+    def _nearest_available_scalar(
+        self,
+        resource_type: str,
+        current_pos: Tuple[int, int],
+        candidates: Optional[List[Resource]] = None,
+    ) -> Optional[Resource]:
+        """Pure-Python fallback for get_nearest_available."""
         best_resource = None
         best_distance = float('inf')
 
-        for key, resource in self.known_resources.items():
+        if candidates is None:
+            candidates = list(self.known_resources.values())
+        for resource in candidates:
             if resource.resource_type != resource_type:
                 continue
             if not resource.is_available:
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional, Protocol
 
@@ -10,6 +11,10 @@ class OcrEntry:
     text: str
     confidence: float
 
+    def __post_init__(self) -> None:
+        # Region names repeat every frame; interning makes region filters pointer compares
+        object.__setattr__(self, "region", sys.intern(self.region))
+
 
 class OcrProvider(Protocol):
     def read(self, regions: Dict[str, Any]) -> List[OcrEntry]:
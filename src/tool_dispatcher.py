@@ -11,11 +11,31 @@ Nightfall - 2026-01-07
 """
 from __future__ import annotations
 
+import importlib
 import logging
 import time
+from collections import defaultdict
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Callable, Dict, List, Optional, Tuple
+from operator import attrgetter
+from typing import (
+    TYPE_CHECKING, Any, Callable, Dict, List, NamedTuple, Optional, Sequence, Set, Tuple,
+)
+
+if TYPE_CHECKING:
+    from src.autonomy import ActivityScheduler, BankTrip, CombatLoop, SkillingLoop, XPTracker
+    from src.autonomy_features import (
+        DailyRotation,
+        FrogPrincessHandler,
+        GoalBasedPlanner,
+        ItemOrganizer,
+        LandmarkNavigator,
+        ObstacleDetector,
+        PrayerFlicker,
+        QuizMasterHandler,
+        ResourceScanner,
+        SafeSpotDetector,
+    )
 
 logger = logging.getLogger(__name__)
 
@@ -36,7 +56,7 @@ class ToolCategory(Enum):
     ADVANCED = "advanced"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ToolDefinition:
     """Definition of an agent tool."""
     name: str
@@ -56,25 +76,44 @@ class ToolRegistry:
 
     def __init__(self):
         self.tools: Dict[str, ToolDefinition] = {}
-        self.categories: Dict[ToolCategory, List[str]] = {cat: [] for cat in ToolCategory}
+        self._handlers: Dict[str, Callable[..., Any]] = {}
+        self.categories: Dict[ToolCategory, Set[str]] = defaultdict(set)
+        self._category_list_cache: Dict[ToolCategory, Tuple[str, ...]] = {}
         self._initialized = False
 
     def register(self, tool: ToolDefinition) -> None:
         """Register a tool."""
         self.tools[tool.name] = tool
-        self.categories[tool.category].append(tool.name)
+        self._handlers[tool.name] = tool.handler
+        self.categories[tool.category].add(tool.name)
+        self._category_list_cache.pop(tool.category, None)
         logger.debug(f"Registered tool: {tool.name} [{tool.category.value}]")
 
     def get(self, name: str) -> Optional[ToolDefinition]:
         """Get a tool by name."""
         return self.tools.get(name)
 
-    def list_tools(self, category: Optional[ToolCategory] = None) -> List[str]:
-        """List available tools."""
+    def list_tools(self, category: Optional[ToolCategory] = None) -> Sequence[str]:
+        """
+        List available tools.
+
+        Per-category listings are sorted tuples cached until the next
+        register() into that category.
+        """
         if category:
-            return self.categories.get(category, [])
+            cached = self._category_list_cache.get(category)
+            if cached is None:
+                cached = tuple(sorted(self.categories.get(category, ())))
+                self._category_list_cache[category] = cached
+            return cached
         return list(self.tools.keys())
 
+    def has_tool(self, name: str, category: Optional[ToolCategory] = None) -> bool:
+        """Check whether a tool is registered (optionally within a category)."""
+        if category:
+            return name in self.categories.get(category, ())
+        return name in self.tools
+
     def dispatch(
         self,
         tool_name: str,
@@ -86,11 +125,12 @@ class ToolRegistry:
 
         Returns the result of the tool execution.
         """
-        tool = self.tools.get(tool_name)
-        if not tool:
+        # _handlers mirrors tools, so one probe of the flat table suffices
+        handler = self._handlers.get(tool_name)
+        if handler is None:
             raise ValueError(f"Unknown tool: {tool_name}")
 
-        return tool.handler(*args, **kwargs)
+        return handler(*args, **kwargs)
 
 
 # Global registry instance
@@ -106,6 +146,70 @@ def get_registry() -> ToolRegistry:
 # INTEGRATED FEATURE MANAGER
 # =============================================================================
 
+class SafeSpotResult(NamedTuple):
+    """Result of find_safe_spot."""
+    position: Any
+    world_position: Any
+    blocking_object: Any
+
+
+class ObstacleResult(NamedTuple):
+    """Result of check_obstacle."""
+    obstacle_type: str
+    can_bypass: bool
+    bypass_action: Any
+
+
+class Waypoint(NamedTuple):
+    """One landmark on a navigate_to_landmark route."""
+    name: str
+    coords: Tuple[int, int, int]
+
+
+class ResourceResult(NamedTuple):
+    """A scanned resource (scan_resources / get_nearest_resource)."""
+    name: str
+    type: str
+    position: Tuple[int, int]
+    available: bool
+
+
+class ActivityResult(NamedTuple):
+    """Result of get_recommended_activity."""
+    name: str
+    description: str
+    skills_trained: List[str]
+    xp_per_hour: Dict[str, int]
+    location: str
+
+
+# Resource attributes matching ResourceResult's fields, fetched in one C-level call
+_RESOURCE_FIELDS = ResourceResult._fields
+_resource_row = attrgetter("name", "resource_type", "position", "is_available")
+
+
+_EMPTY: Dict[str, Any] = {}
+_DEFAULT_PRAYER_TAB = {"x": 560, "y": 210, "width": 180, "height": 260}
+
+
+def _normalize_skill_levels(skills: Dict[str, Any]) -> Dict[str, int]:
+    """Lowercased skill name -> level from a snapshot's account skills."""
+    levels: Dict[str, int] = {}
+    for skill_name, data in skills.items():
+        if isinstance(data, dict):
+            levels[skill_name.lower()] = data.get("level", 1)
+        elif isinstance(data, int):
+            levels[skill_name.lower()] = data
+    return levels
+
+
+def _lazy_factory(module_name: str, class_name: str) -> Callable[[], Any]:
+    """Return a factory that imports module_name and instantiates class_name."""
+    def factory() -> Any:
+        return getattr(importlib.import_module(module_name), class_name)()
+    return factory
+
+
 class FeatureManager:
     """
     Manages all integrated features and their state.
@@ -117,74 +221,57 @@ class FeatureManager:
         self.window_bounds = window_bounds
         self.snapshot_fn = snapshot_fn
 
-        # Import and initialize features
-        self._init_features()
-
-    def _init_features(self) -> None:
-        """Initialize all feature handlers."""
-        # Import autonomy features
-        try:
-            from src.autonomy_features import (
-                ObstacleDetector,
-                LandmarkNavigator,
-                ItemOrganizer,
-                GoalBasedPlanner,
-                DailyRotation,
-                PrayerFlicker,
-                QuizMasterHandler,
-                FrogPrincessHandler,
-                SafeSpotDetector,
-                ResourceScanner,
-            )
-
-            self.obstacle_detector = ObstacleDetector()
-            self.landmark_navigator = LandmarkNavigator()
-            self.item_organizer = ItemOrganizer()
-            self.goal_planner = GoalBasedPlanner()
-            self.daily_rotation = DailyRotation()
-            self.prayer_flicker = PrayerFlicker()
-            self.quiz_handler = QuizMasterHandler()
-            self.frog_handler = FrogPrincessHandler()
-            self.safe_spot_detector = SafeSpotDetector()
-            self.resource_scanner = ResourceScanner()
-
-            logger.info("Autonomy features initialized")
-        except ImportError as e:
-            logger.warning(f"Could not import autonomy_features: {e}")
-            self._set_feature_stubs()
-
-        # Import standard autonomy
-        try:
-            from src.autonomy import (
-                SkillingLoop,
-                CombatLoop,
-                BankTrip,
-                XPTracker,
-                ActivityScheduler,
-            )
+        # Feature handlers are built on first use; see _ensure().
+        self._factories: Dict[str, Callable[[], Any]] = {
+            "obstacle_detector": _lazy_factory("src.autonomy_features", "ObstacleDetector"),
+            "landmark_navigator": _lazy_factory("src.autonomy_features", "LandmarkNavigator"),
+            "item_organizer": _lazy_factory("src.autonomy_features", "ItemOrganizer"),
+            "goal_planner": _lazy_factory("src.autonomy_features", "GoalBasedPlanner"),
+            "daily_rotation": _lazy_factory("src.autonomy_features", "DailyRotation"),
+            "prayer_flicker": _lazy_factory("src.autonomy_features", "PrayerFlicker"),
+            "quiz_handler": _lazy_factory("src.autonomy_features", "QuizMasterHandler"),
+            "frog_handler": _lazy_factory("src.autonomy_features", "FrogPrincessHandler"),
+            "safe_spot_detector": _lazy_factory("src.autonomy_features", "SafeSpotDetector"),
+            "resource_scanner": _lazy_factory("src.autonomy_features", "ResourceScanner"),
+            "xp_tracker": _lazy_factory("src.autonomy", "XPTracker"),
+            "activity_scheduler": _lazy_factory("src.autonomy", "ActivityScheduler"),
+        }
+        self._resolved: Set[str] = set()
+
+        self.obstacle_detector: Optional[ObstacleDetector] = None
+        self.landmark_navigator: Optional[LandmarkNavigator] = None
+        self.item_organizer: Optional[ItemOrganizer] = None
+        self.goal_planner: Optional[GoalBasedPlanner] = None
+        self.daily_rotation: Optional[DailyRotation] = None
+        self.prayer_flicker: Optional[PrayerFlicker] = None
+        self.quiz_handler: Optional[QuizMasterHandler] = None
+        self.frog_handler: Optional[FrogPrincessHandler] = None
+        self.safe_spot_detector: Optional[SafeSpotDetector] = None
+        self.resource_scanner: Optional[ResourceScanner] = None
+        self.xp_tracker: Optional[XPTracker] = None
+        self.activity_scheduler: Optional[ActivityScheduler] = None
+
+        self.active_skilling_loop: Optional[SkillingLoop] = None
+        self.active_combat_loop: Optional[CombatLoop] = None
+        self.active_bank_trip: Optional[BankTrip] = None
+
+        self._skills_norm_cache: Tuple[Optional[Dict[str, Any]], Dict[str, int]] = (None, {})
+
+    def _ensure(self, attr: str) -> Any:
+        """
+        Build a feature handler on first use and memoize it on self.
 
-            self.xp_tracker = XPTracker()
-            self.activity_scheduler = ActivityScheduler()
-            self.active_skilling_loop: Optional[SkillingLoop] = None
-            self.active_combat_loop: Optional[CombatLoop] = None
-            self.active_bank_trip: Optional[BankTrip] = None
-
-            logger.info("Standard autonomy initialized")
-        except ImportError as e:
-            logger.warning(f"Could not import autonomy: {e}")
-
-    def _set_feature_stubs(self) -> None:
-        """Set stub objects when features unavailable."""
-        self.obstacle_detector = None
-        self.landmark_navigator = None
-        self.item_organizer = None
-        self.goal_planner = None
-        self.daily_rotation = None
-        self.prayer_flicker = None
-        self.quiz_handler = None
-        self.frog_handler = None
-        self.safe_spot_detector = None
-        self.resource_scanner = None
+        Returns None if the backing module could not be imported. Any other
+        constructor error propagates and the next call tries again.
+        """
+        if attr not in self._resolved:
+            try:
+                setattr(self, attr, self._factories[attr]())
+                logger.debug(f"Initialized feature: {attr}")
+            except ImportError as e:
+                logger.warning(f"Could not initialize {attr}: {e}")
+            self._resolved.add(attr)
+        return getattr(self, attr)
 
     # =========================================================================
     # PRAYER FLICKING
@@ -192,7 +279,8 @@ class FeatureManager:
 
     def start_prayer_flicking(self, prayer_name: str) -> bool:
         """Start flicking a prayer."""
-        if not self.prayer_flicker:
+        prayer_flicker = self._ensure("prayer_flicker")
+        if not prayer_flicker:
             return False
 
         from src.autonomy_features import PrayerType
@@ -208,7 +296,7 @@ class FeatureManager:
 
         prayer = prayer_map.get(prayer_name.lower())
         if prayer:
-            self.prayer_flicker.start_flicking(prayer)
+            prayer_flicker.start_flicking(prayer)
             return True
         return False
 
@@ -228,20 +316,18 @@ class FeatureManager:
             return None
 
         # Get prayer tab bounds from snapshot
-        roi = snapshot.get("roi", {})
-        prayer_tab = roi.get("prayer", {"x": 560, "y": 210, "width": 180, "height": 260})
+        prayer_tab = (snapshot.get("roi") or _EMPTY).get("prayer", _DEFAULT_PRAYER_TAB)
 
-        actions = []
-        for prayer in self.prayer_flicker.active_prayers:
-            pos = self.prayer_flicker.get_prayer_position(
-                prayer,
-                (prayer_tab["x"], prayer_tab["y"], prayer_tab["width"], prayer_tab["height"])
-            )
-            actions.append({
+        tab_bounds = (prayer_tab["x"], prayer_tab["y"], prayer_tab["width"], prayer_tab["height"])
+        get_position = self.prayer_flicker.get_prayer_position
+        actions = [
+            {
                 "type": "click",
-                "target": {"x": pos[0], "y": pos[1]},
+                "target": {"x": (pos := get_position(prayer, tab_bounds))[0], "y": pos[1]},
                 "prayer": prayer.value,
-            })
+            }
+            for prayer in self.prayer_flicker.active_prayers
+        ]
 
         self.prayer_flicker.last_flick_time = time.time()
         return {"action": "prayer_flick", "clicks": actions}
@@ -254,24 +340,20 @@ class FeatureManager:
         self,
         target_npc: str,
         snapshot: Dict[str, Any],
-    ) -> Optional[Dict[str, Any]]:
+    ) -> Optional[SafeSpotResult]:
         """Find a safe spot for attacking an NPC."""
-        if not self.safe_spot_detector:
+        safe_spot_detector = self._ensure("safe_spot_detector")
+        if not safe_spot_detector:
             return None
 
-        runelite = snapshot.get("runelite_data", {})
-        player_world = runelite.get("player_world")
+        player_world = (snapshot.get("runelite_data") or _EMPTY).get("player_world")
 
         if not player_world:
             return None
 
-        spot = self.safe_spot_detector.find_safe_spot(tuple(player_world), target_npc)
+        spot = safe_spot_detector.find_safe_spot(tuple(player_world), target_npc)
         if spot:
-            return {
-                "position": spot.position,
-                "world_position": spot.world_position,
-                "blocking_object": spot.blocking_object,
-            }
+            return SafeSpotResult(spot.position, spot.world_position, spot.blocking_object)
         return None
 
     # =========================================================================
@@ -285,16 +367,14 @@ class FeatureManager:
         Returns action dict if event detected and handled.
         """
         # Check for quiz master
-        if self.quiz_handler and self.quiz_handler.detect_quiz_master(snapshot):
+        quiz_handler = self._ensure("quiz_handler")
+        if quiz_handler and quiz_handler.detect_quiz_master(snapshot):
             # Get question from dialogue
-            ui = snapshot.get("ui", {})
-            dialogue_text = " ".join(ui.get("dialogue_options", []))
+            options = (snapshot.get("ui") or _EMPTY).get("dialogue_options", [])
+            dialogue_text = " ".join(options)
 
             if dialogue_text:
-                answer = self.quiz_handler.answer_question(
-                    dialogue_text,
-                    ui.get("dialogue_options", [])
-                )
+                answer = quiz_handler.answer_question(dialogue_text, options)
                 return {
                     "action": "random_event",
                     "event_type": "quiz_master",
@@ -302,8 +382,9 @@ class FeatureManager:
                 }
 
         # Check for frog princess
-        if self.frog_handler and self.frog_handler.detect_frog_event(snapshot):
-            target = self.frog_handler.get_kiss_target(snapshot)
+        frog_handler = self._ensure("frog_handler")
+        if frog_handler and frog_handler.detect_frog_event(snapshot):
+            target = frog_handler.get_kiss_target(snapshot)
             if target:
                 return {
                     "action": "random_event",
@@ -321,27 +402,25 @@ class FeatureManager:
         self,
         snapshot: Dict[str, Any],
         target_direction: Tuple[int, int],
-    ) -> Optional[Dict[str, Any]]:
+    ) -> Optional[ObstacleResult]:
         """Check for obstacles in a direction."""
-        if not self.obstacle_detector:
+        obstacle_detector = self._ensure("obstacle_detector")
+        if not obstacle_detector:
             return None
 
-        obstacle = self.obstacle_detector.detect_obstacle(snapshot, target_direction)
+        obstacle = obstacle_detector.detect_obstacle(snapshot, target_direction)
         if obstacle:
-            return {
-                "obstacle_type": obstacle.obstacle_type.value,
-                "can_bypass": obstacle.can_bypass,
-                "bypass_action": obstacle.bypass_action,
-            }
+            return ObstacleResult(obstacle.obstacle_type.value, obstacle.can_bypass, obstacle.bypass_action)
         return None
 
     def navigate_to_landmark(
         self,
         target_landmark: str,
         snapshot: Dict[str, Any],
-    ) -> Optional[List[Dict[str, Any]]]:
+    ) -> Optional[List[Waypoint]]:
         """Get navigation waypoints to a landmark."""
-        if not self.landmark_navigator:
+        landmark_navigator = self._ensure("landmark_navigator")
+        if not landmark_navigator:
             return None
 
         from src.autonomy_features import LANDMARKS
@@ -350,69 +429,69 @@ class FeatureManager:
         if not landmark:
             return None
 
-        runelite = snapshot.get("runelite_data", {})
-        player_world = runelite.get("player_world")
+        player_world = (snapshot.get("runelite_data") or _EMPTY).get("player_world")
 
         if not player_world:
             return None
 
-        route = self.landmark_navigator.plan_route(
+        route = landmark_navigator.plan_route(
             tuple(player_world),
             landmark.world_coords
         )
 
-        return [
-            {"name": lm.name, "coords": lm.world_coords}
-            for lm in route
-        ]
+        return [Waypoint(lm.name, lm.world_coords) for lm in route]
 
     # =========================================================================
     # RESOURCE SCANNING
     # =========================================================================
 
-    def scan_resources(self, snapshot: Dict[str, Any]) -> List[Dict[str, Any]]:
+    def scan_resources_arrays(self, snapshot: Dict[str, Any]) -> Dict[str, Tuple[Any, ...]]:
+        """
+        Scan for nearby resources, column-wise.
+
+        Returns one tuple per field in _RESOURCE_FIELDS, aligned by index,
+        so planner code can work on whole columns without per-resource dicts.
+        """
+        rows: List[Tuple[Any, ...]] = []
+        resource_scanner = self._ensure("resource_scanner")
+        if resource_scanner:
+            rows = list(map(_resource_row, resource_scanner.scan_area(snapshot)))
+
+        columns = tuple(zip(*rows)) or ((),) * len(_RESOURCE_FIELDS)
+        return dict(zip(_RESOURCE_FIELDS, columns))
+
+    def scan_resources(self, snapshot: Dict[str, Any]) -> List[ResourceResult]:
         """Scan for nearby resources."""
-        if not self.resource_scanner:
+        resource_scanner = self._ensure("resource_scanner")
+        if not resource_scanner:
             return []
-
-        resources = self.resource_scanner.scan_area(snapshot)
         return [
-            {
-                "name": r.name,
-                "type": r.resource_type,
-                "position": r.position,
-                "available": r.is_available,
-            }
-            for r in resources
+            ResourceResult._make(_resource_row(resource))
+            for resource in resource_scanner.scan_area(snapshot)
         ]
 
     def get_nearest_resource(
         self,
         resource_type: str,
         snapshot: Dict[str, Any],
-    ) -> Optional[Dict[str, Any]]:
+    ) -> Optional[ResourceResult]:
         """Get the nearest available resource of a type."""
-        if not self.resource_scanner:
+        resource_scanner = self._ensure("resource_scanner")
+        if not resource_scanner:
             return None
 
-        runelite = snapshot.get("runelite_data", {})
-        player_pos = runelite.get("player_screen")
+        player_pos = (snapshot.get("runelite_data") or _EMPTY).get("player_screen")
 
         if not player_pos:
             return None
 
-        resource = self.resource_scanner.get_nearest_available(
+        resource = resource_scanner.get_nearest_available(
             resource_type,
             tuple(player_pos)
         )
 
         if resource:
-            return {
-                "name": resource.name,
-                "type": resource.resource_type,
-                "position": resource.position,
-                "available": resource.is_available,
-            }
+            return ResourceResult._make(_resource_row(resource))
         return None
 
     # =========================================================================
@@ -427,7 +506,8 @@ class FeatureManager:
         priority: int = 1,
     ) -> bool:
         """Add a goal to the planner."""
-        if not self.goal_planner:
+        goal_planner = self._ensure("goal_planner")
+        if not goal_planner:
             return False
 
         from src.autonomy_features import Goal, GoalType
@@ -450,37 +530,34 @@ class FeatureManager:
             target_value=target_value,
             priority=priority,
         )
-        self.goal_planner.add_goal(goal)
+        goal_planner.add_goal(goal)
         return True
 
     def get_recommended_activity(
         self,
         snapshot: Dict[str, Any],
-    ) -> Optional[Dict[str, Any]]:
+    ) -> Optional[ActivityResult]:
         """Get recommended activity based on goals."""
-        if not self.goal_planner:
+        goal_planner = self._ensure("goal_planner")
+        if not goal_planner:
             return None
 
-        # Get current skills from snapshot
-        account = snapshot.get("account", {})
-        skills = account.get("skills", {})
-
-        current_skills = {}
-        for skill_name, data in skills.items():
-            if isinstance(data, dict):
-                current_skills[skill_name.lower()] = data.get("level", 1)
-            elif isinstance(data, int):
-                current_skills[skill_name.lower()] = data
-
-        activity = self.goal_planner.select_activity(current_skills)
+        # Normalize once per snapshot; the cache holds the snapshot itself
+        # so its id cannot be recycled while cached.
+        cached_snapshot, levels = self._skills_norm_cache
+        if cached_snapshot is not snapshot:
+            skills = (snapshot.get("account") or _EMPTY).get("skills") or _EMPTY
+            levels = _normalize_skill_levels(skills)
+            self._skills_norm_cache = (snapshot, levels)
+        activity = goal_planner.select_activity(levels)
         if activity:
-            return {
-                "name": activity.name,
-                "description": activity.description,
-                "skills_trained": activity.skills_trained,
-                "xp_per_hour": activity.xp_per_hour,
-                "location": activity.location,
-            }
+            return ActivityResult(
+                activity.name,
+                activity.description,
+                activity.skills_trained,
+                activity.xp_per_hour,
+                activity.location,
+            )
         return None
 
 
@@ -632,6 +709,11 @@ __all__ = [
     "ToolCategory",
     "FeatureManager",
     "PriorityTickSystem",
+    "SafeSpotResult",
+    "ObstacleResult",
+    "Waypoint",
+    "ResourceResult",
+    "ActivityResult",
     "get_registry",
     "register_all_tools",
 ]
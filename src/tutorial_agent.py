@@ -16,6 +16,7 @@ from src.game_actions import (
     get_chat_logger,
 )
 from src.local_model import run_local_model
+from src.perception import find_window
 
 
 def focus_runelite():
@@ -36,9 +37,41 @@ def focus_runelite():
     return hwnd is not None
 
 
-def capture_screen():
-    """Capture the full screen."""
-    return ImageGrab.grab()
+_SCT = None  # persistent mss handle, created on first capture
+
+# Re-locate the game window this often so moves/resizes are picked up
+BOUNDS_REFRESH_TICKS = 20
+
+
+def capture_screen(bounds=None):
+    """
+    Capture the game window (left, top, right, bottom), or the primary
+    screen when bounds is None.
+
+    Reuses one mss handle across ticks; falls back to ImageGrab if mss
+    is not installed.
+    """
+    global _SCT
+    if _SCT is None:
+        try:
+            import mss
+            _SCT = mss.mss()
+        except ImportError:
+            return ImageGrab.grab(bbox=bounds, all_screens=False)
+
+    if bounds is None:
+        monitor = _SCT.monitors[1]
+    else:
+        left, top, right, bottom = bounds
+        monitor = {"left": left, "top": top, "width": right - left, "height": bottom - top}
+    shot = _SCT.grab(monitor)
+    return Image.frombytes("RGB", shot.size, shot.rgb)
+
+
+def window_bounds():
+    """Current RuneLite window bounds, or None to capture the full screen."""
+    window = find_window("RuneLite")
+    return window.bounds if window else None
 
 
 def save_screenshot(img, path="data/current_screen.png"):
@@ -46,16 +79,19 @@ def save_screenshot(img, path="data/current_screen.png"):
     img.save(path)
 
 
-def build_context(screenshot_path: str) -> str:
-    """Build context string for the model."""
-    return f"""You are playing OSRS Tutorial Island. Look at the screenshot and decide ONE action.
-
-Current screenshot saved at: {screenshot_path}
+def build_context(screenshot_path=None) -> str:
+    """
+    Build context string for the model.
 
+    The screenshot path is only mentioned when this tick actually wrote one.
+    """
+    saved_line = f"\nCurrent screenshot saved at: {screenshot_path}\n" if screenshot_path else ""
+    return f"""You are playing OSRS Tutorial Island. Look at the screenshot and decide ONE action.
+{saved_line}
 AVAILABLE ACTIONS:
 - SPACEBAR: Continue dialogue
 - NUMBER 1-5: Select dialogue option
-- CLICK x,y: Click at screen coordinates
+- CLICK x,y: Click at screenshot coordinates
 - FISH: Click on a fishing spot (cyan highlighted in water)
 - WAIT: Do nothing this tick
 
@@ -104,9 +140,15 @@ def parse_action(response: str) -> tuple:
     return ("wait", None)
 
 
-def execute_action(action_type: str, action_data):
-    """Execute the parsed action."""
+def execute_action(action_type: str, action_data, origin=(0, 0)):
+    """
+    Execute the parsed action.
+
+    Click coordinates are relative to the captured screenshot; origin is
+    the screen position of its top-left corner (the window's left, top).
+    """
     print(f"  Executing: {action_type} {action_data}")
+    left, top = origin
 
     if action_type == "spacebar":
         press_key_name("SPACE", hold_ms=50)
@@ -118,7 +160,7 @@ def execute_action(action_type: str, action_data):
 
     elif action_type == "click":
         x, y = action_data
-        move_mouse_path(x, y, steps=20)
+        move_mouse_path(left + x, top + y, steps=20)
         time.sleep(0.1)
         click()
         time.sleep(0.2)
@@ -126,7 +168,7 @@ def execute_action(action_type: str, action_data):
     elif action_type == "fish":
         # Click on approximate fishing spot location
         # Fishing spots are in the pond area - around x=550, y=400 based on screenshots
-        move_mouse_path(550, 380, steps=20)
+        move_mouse_path(left + 550, top + 380, steps=20)
         time.sleep(0.1)
         click()
         time.sleep(0.3)
@@ -135,7 +177,7 @@ def execute_action(action_type: str, action_data):
         time.sleep(0.5)
 
 
-def run_agent(max_iterations=100, tick_delay=1.0):
+def run_agent(max_iterations=100, tick_delay=1.0, debug=False):
     """Main agent loop."""
     print("=" * 50)
     print("Tutorial Island Agent Starting")
@@ -146,20 +188,28 @@ def run_agent(max_iterations=100, tick_delay=1.0):
         print("ERROR: Could not find RuneLite window!")
         return
 
+    bounds = None
+
     print("RuneLite focused. Starting agent loop...")
     print("Press Ctrl+C to stop\n")
 
     for i in range(max_iterations):
+        screenshot = None
         try:
             print(f"\n[Tick {i+1}]")
 
             # 1. Capture screen
-            screenshot = capture_screen()
-            save_screenshot(screenshot)
+            if bounds is None or i % BOUNDS_REFRESH_TICKS == 0:
+                bounds = window_bounds()
+            screenshot = capture_screen(bounds)
+            screenshot_path = None
+            if debug:
+                screenshot_path = "data/current_screen.png"
+                save_screenshot(screenshot, screenshot_path)
             print(f"  Captured: {screenshot.size}")
 
             # 2. Build context for model
-            context = build_context("data/current_screen.png")
+            context = build_context(screenshot_path)
 
             # 3. Ask model for action
             print("  Asking model...")
@@ -171,7 +221,7 @@ def run_agent(max_iterations=100, tick_delay=1.0):
             print(f"  Parsed: {action_type} -> {action_data}")
 
             # 5. Execute action
-            execute_action(action_type, action_data)
+            execute_action(action_type, action_data, bounds[:2] if bounds else (0, 0))
 
             # 6. Log for debugging
             log_chat(f"Tick {i+1}: {action_type} {action_data}", source="agent")
@@ -184,6 +234,9 @@ def run_agent(max_iterations=100, tick_delay=1.0):
             break
         except Exception as e:
             print(f"  ERROR: {e}")
+            if screenshot is not None:
+                save_screenshot(screenshot)
+            bounds = None  # the window may have moved; re-locate next tick
             time.sleep(1)
 
     print("\nAgent finished.")
@@ -194,6 +247,7 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser()
     parser.add_argument("--ticks", type=int, default=50)
     parser.add_argument("--delay", type=float, default=1.5)
+    parser.add_argument("--debug", action="store_true", help="Save a screenshot every tick")
     args = parser.parse_args()
 
-    run_agent(max_iterations=args.ticks, tick_delay=args.delay)
+    run_agent(max_iterations=args.ticks, tick_delay=args.delay, debug=args.debug)
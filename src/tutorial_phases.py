@@ -18,13 +18,24 @@ Nightfall - 2026-01-07
 """
 from __future__ import annotations
 
+import bisect
+import functools
 import logging
 import re
+import sys
 import time
 from abc import ABC, abstractmethod
+from collections import deque
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Callable, Dict, List, Optional, Tuple
+from types import MappingProxyType
+from typing import Any, Callable, Deque, Dict, List, Mapping, Optional, Sequence, Tuple, Type
+
+try:
+    import ahocorasick
+    HAS_AHOCORASICK = True
+except ImportError:
+    HAS_AHOCORASICK = False
 
 logger = logging.getLogger(__name__)
 
@@ -49,12 +60,21 @@ class TutorialPhase(Enum):
     COMPLETE = "complete"
 
 
+# Shared read-only default for missing snapshot sections (never mutated)
+_EMPTY: Dict[str, Any] = {}
+
+# Tutorial order, materialized once, and each phase's position in it
+_PHASE_ORDER: Tuple[TutorialPhase, ...] = tuple(TutorialPhase)
+_PHASE_INDEX: Dict[TutorialPhase, int] = {phase: idx for idx, phase in enumerate(_PHASE_ORDER)}
+_PHASE_COUNT = len(_PHASE_ORDER)
+
+
 # =============================================================================
 # PHASE DETECTION (T26)
 # =============================================================================
 
 # Keywords in tutorial hints that indicate each phase
-PHASE_KEYWORDS = {
+PHASE_KEYWORDS: Dict[TutorialPhase, Sequence[str]] = {
     TutorialPhase.GIELINOR_GUIDE: [
         "gielinor guide", "getting started", "talk to the gielinor guide",
         "character", "experience", "options", "settings",
@@ -101,6 +121,11 @@ PHASE_KEYWORDS = {
         "adventure", "world",
     ],
 }
+# Freeze as tuples of interned strings: compact, immutable, identity-comparable
+PHASE_KEYWORDS = {
+    phase: tuple(sys.intern(kw) for kw in keywords)
+    for phase, keywords in PHASE_KEYWORDS.items()
+}
 
 # Varbit 281 progress values for each phase
 VARBIT_PROGRESS = {
@@ -117,11 +142,74 @@ VARBIT_PROGRESS = {
     1000: TutorialPhase.COMPLETE,
 }
 
+# VARBIT_PROGRESS sorted once into parallel threshold/phase sequences for bisect
+_VARBIT_THRESHOLDS: Tuple[int, ...] = tuple(sorted(VARBIT_PROGRESS))
+_VARBIT_PHASES: Tuple[TutorialPhase, ...] = tuple(VARBIT_PROGRESS[t] for t in _VARBIT_THRESHOLDS)
+
+# Varbit 281 value at which each handled phase is complete
+_PHASE_COMPLETE_THRESHOLD: Dict[TutorialPhase, int] = {
+    TutorialPhase.GIELINOR_GUIDE: 20,  # Moving to Survival Expert
+    TutorialPhase.SURVIVAL_EXPERT: 70,  # Moving to Master Chef
+    TutorialPhase.MASTER_CHEF: 120,
+    TutorialPhase.QUEST_GUIDE: 170,
+    TutorialPhase.MINING_INSTRUCTOR: 300,
+    TutorialPhase.COMBAT_INSTRUCTOR: 510,
+    TutorialPhase.FINANCIAL_ADVISOR: 525,
+    TutorialPhase.BROTHER_BRACE: 610,
+    TutorialPhase.MAGIC_INSTRUCTOR: 1000,
+}
+
+# When keywords from several phases appear in one hint, the phase listed
+# first in PHASE_KEYWORDS wins. Each keyword maps to its best phase rank.
+_RANKED_PHASES: Tuple[TutorialPhase, ...] = tuple(PHASE_KEYWORDS)
+_KEYWORD_RANK: Dict[str, int] = {}
+for _rank, _keywords in enumerate(PHASE_KEYWORDS.values()):
+    for _kw in _keywords:
+        _KEYWORD_RANK.setdefault(_kw, _rank)
+
+
+def _build_keyword_automaton():
+    """Build one Aho-Corasick automaton over every phase keyword."""
+    automaton = ahocorasick.Automaton()
+    for keyword, rank in _KEYWORD_RANK.items():
+        automaton.add_word(keyword, rank)
+    automaton.make_automaton()
+    return automaton
+
+
+_KEYWORD_AUTOMATON = _build_keyword_automaton() if HAS_AHOCORASICK else None
+
+# Fallback matcher: one compiled alternation per phase, tried in priority
+# order. Longest keywords first so the reported match is the most specific.
+_PHASE_KEYWORD_RES: Tuple[Tuple[TutorialPhase, "re.Pattern[str]"], ...] = tuple(
+    (phase, re.compile("|".join(re.escape(kw) for kw in sorted(keywords, key=len, reverse=True))))
+    for phase, keywords in PHASE_KEYWORDS.items()
+)
+
+# Tutor NPC names (lowercase) in priority order for the NPC fallback
+_NPC_TO_PHASE: Dict[str, TutorialPhase] = {
+    "gielinor guide": TutorialPhase.GIELINOR_GUIDE,
+    "survival expert": TutorialPhase.SURVIVAL_EXPERT,
+    "master chef": TutorialPhase.MASTER_CHEF,
+    "quest guide": TutorialPhase.QUEST_GUIDE,
+    "mining instructor": TutorialPhase.MINING_INSTRUCTOR,
+    "combat instructor": TutorialPhase.COMBAT_INSTRUCTOR,
+    "financial advisor": TutorialPhase.FINANCIAL_ADVISOR,
+    "brother brace": TutorialPhase.BROTHER_BRACE,
+    "magic instructor": TutorialPhase.MAGIC_INSTRUCTOR,
+}
+_NPC_RANK: Dict[str, int] = {name: rank for rank, name in enumerate(_NPC_TO_PHASE)}
+_NPC_PHASES: Tuple[TutorialPhase, ...] = tuple(_NPC_TO_PHASE.values())
+
 
+@functools.lru_cache(maxsize=256)
 def detect_phase_from_hint(hint_text: str) -> Optional[TutorialPhase]:
     """
     Detect tutorial phase from hint text (T26).
 
+    Results are cached by hint text, since the on-screen hint usually
+    stays the same across many consecutive snapshots.
+
     Args:
         hint_text: The tutorial hint text from OCR
 
@@ -133,14 +221,40 @@ def detect_phase_from_hint(hint_text: str) -> Optional[TutorialPhase]:
 
     hint_lower = hint_text.lower()
 
+    # Single pass over the hint, keeping the best-ranked keyword hit;
+    # a rank-0 hit cannot be beaten, so stop scanning there
+    if _KEYWORD_AUTOMATON is not None:
+        no_match = len(_RANKED_PHASES)
+        best = no_match
+        for _, rank in _KEYWORD_AUTOMATON.iter(hint_lower):
+            if rank < best:
+                best = rank
+                if not rank:
+                    break
+        return _RANKED_PHASES[best] if best < no_match else None
+
     # Check each phase's keywords
-    for phase, keywords in PHASE_KEYWORDS.items():
-        if any(kw in hint_lower for kw in keywords):
+    for phase, pattern in _PHASE_KEYWORD_RES:
+        if pattern.search(hint_lower):
             return phase
 
     return None
 
 
+def _tutorial_progress(snapshot: Dict[str, Any], progress: Optional[int] = None) -> int:
+    """
+    Varbit 281 value for a snapshot.
+
+    progress is the value the caller already read from this snapshot
+    (TutorialOrchestrator.update reads it once per tick); without it the
+    value comes from runelite_data.
+    """
+    if progress is not None:
+        return progress
+    runelite = snapshot.get("runelite_data", _EMPTY)
+    return runelite.get("tutorial_progress", 0)
+
+
 def detect_phase_from_varbit(varbit_value: int) -> TutorialPhase:
     """
     Detect tutorial phase from varbit 281 progress value.
@@ -152,15 +266,8 @@ def detect_phase_from_varbit(varbit_value: int) -> TutorialPhase:
         Current tutorial phase
     """
     # Find the highest varbit value that's <= current progress
-    current_phase = TutorialPhase.CHARACTER_CREATION
-
-    for threshold, phase in sorted(VARBIT_PROGRESS.items()):
-        if varbit_value >= threshold:
-            current_phase = phase
-        else:
-            break
-
-    return current_phase
+    idx = bisect.bisect_right(_VARBIT_THRESHOLDS, varbit_value) - 1
+    return _VARBIT_PHASES[idx] if idx >= 0 else TutorialPhase.CHARACTER_CREATION
 
 
 def detect_phase(snapshot: Dict[str, Any]) -> TutorialPhase:
@@ -176,14 +283,14 @@ def detect_phase(snapshot: Dict[str, Any]) -> TutorialPhase:
         Current tutorial phase
     """
     # Try varbit first (most reliable)
-    runelite = snapshot.get("runelite_data", {})
+    runelite = snapshot.get("runelite_data", _EMPTY)
     tutorial_progress = runelite.get("tutorial_progress", 0)
 
     if tutorial_progress > 0:
         return detect_phase_from_varbit(tutorial_progress)
 
     # Fall back to hint detection
-    ocr = snapshot.get("ocr", [])
+    ocr = snapshot.get("ocr", ())
     for entry in ocr:
         if isinstance(entry, dict) and entry.get("region") == "tutorial_hint":
             hint = entry.get("text", "")
@@ -192,27 +299,25 @@ def detect_phase(snapshot: Dict[str, Any]) -> TutorialPhase:
                 return phase
 
     # Check for NPCs as fallback
-    npcs = runelite.get("npcs_on_screen", [])
-    npc_names = [npc.get("name", "").lower() for npc in npcs]
-
-    if "gielinor guide" in npc_names:
-        return TutorialPhase.GIELINOR_GUIDE
-    if "survival expert" in npc_names:
-        return TutorialPhase.SURVIVAL_EXPERT
-    if "master chef" in npc_names:
-        return TutorialPhase.MASTER_CHEF
-    if "quest guide" in npc_names:
-        return TutorialPhase.QUEST_GUIDE
-    if "mining instructor" in npc_names:
-        return TutorialPhase.MINING_INSTRUCTOR
-    if "combat instructor" in npc_names:
-        return TutorialPhase.COMBAT_INSTRUCTOR
-    if "financial advisor" in npc_names:
-        return TutorialPhase.FINANCIAL_ADVISOR
-    if "brother brace" in npc_names:
-        return TutorialPhase.BROTHER_BRACE
-    if "magic instructor" in npc_names:
-        return TutorialPhase.MAGIC_INSTRUCTOR
+    # One hash lookup per NPC; the highest-priority tutor on screen wins
+    npcs = runelite.get("npcs_on_screen")
+    if not npcs:
+        return TutorialPhase.CHARACTER_CREATION
+
+    no_match = len(_NPC_PHASES)
+    best_rank = no_match
+    for npc in npcs:
+        name = npc.get("name")
+        if not name:
+            continue
+        rank = _NPC_RANK.get(name.lower(), no_match)
+        if rank < best_rank:
+            best_rank = rank
+            if rank == 0:
+                break
+
+    if best_rank < no_match:
+        return _NPC_PHASES[best_rank]
 
     return TutorialPhase.CHARACTER_CREATION
 
@@ -221,12 +326,12 @@ def detect_phase(snapshot: Dict[str, Any]) -> TutorialPhase:
 # PHASE TRANSITION VERIFICATION (T27)
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class PhaseTransition:
     """Record of a phase transition."""
     from_phase: TutorialPhase
     to_phase: TutorialPhase
-    timestamp: float
+    timestamp: float  # time.monotonic() at detection
     verified: bool = False
     varbit_before: int = 0
     varbit_after: int = 0
@@ -241,19 +346,32 @@ class PhaseVerifier:
 
     def __init__(self):
         self.current_phase: TutorialPhase = TutorialPhase.CHARACTER_CREATION
-        self.transitions: List[PhaseTransition] = []
+        # Recent history only; transition_count keeps the running total
+        self.transitions: Deque[PhaseTransition] = deque(maxlen=256)
+        self.transition_count: int = 0
         self.last_varbit: int = 0
 
-    def update(self, snapshot: Dict[str, Any]) -> Optional[PhaseTransition]:
+    def update(self, snapshot: Dict[str, Any], progress: Optional[int] = None) -> Optional[PhaseTransition]:
         """
         Update state from snapshot and detect transitions.
 
+        Args:
+            snapshot: Current game snapshot
+            progress: Varbit 281 already read from this snapshot, if any
+
         Returns:
             PhaseTransition if a transition occurred, None otherwise
         """
-        detected_phase = detect_phase(snapshot)
-        runelite = snapshot.get("runelite_data", {})
-        current_varbit = runelite.get("tutorial_progress", 0)
+        current_varbit = _tutorial_progress(snapshot, progress)
+
+        # A non-zero varbit fully determines the phase, so an unchanged
+        # value means current_phase is still correct.
+        if current_varbit > 0:
+            if current_varbit == self.last_varbit:
+                return None
+            detected_phase = detect_phase_from_varbit(current_varbit)
+        else:
+            detected_phase = detect_phase(snapshot)
 
         if detected_phase != self.current_phase:
             # Verify transition is valid
@@ -262,20 +380,25 @@ class PhaseVerifier:
             transition = PhaseTransition(
                 from_phase=self.current_phase,
                 to_phase=detected_phase,
-                timestamp=time.time(),
+                timestamp=time.monotonic(),
                 verified=valid,
                 varbit_before=self.last_varbit,
                 varbit_after=current_varbit,
             )
 
             self.transitions.append(transition)
+            self.transition_count += 1
             self.current_phase = detected_phase
             self.last_varbit = current_varbit
 
             if valid:
-                logger.info(f"Phase transition: {transition.from_phase.value} -> {transition.to_phase.value}")
+                logger.info("Phase transition: %s -> %s", transition.from_phase.value, transition.to_phase.value)
             else:
-                logger.warning(f"Unexpected phase transition: {transition.from_phase.value} -> {transition.to_phase.value}")
+                logger.warning(
+                    "Unexpected phase transition: %s -> %s",
+                    transition.from_phase.value,
+                    transition.to_phase.value,
+                )
 
             return transition
 
@@ -288,37 +411,35 @@ class PhaseVerifier:
         to_phase: TutorialPhase,
     ) -> bool:
         """Check if a phase transition is valid (in correct order)."""
-        phase_order = list(TutorialPhase)
-
-        try:
-            from_idx = phase_order.index(from_phase)
-            to_idx = phase_order.index(to_phase)
-
-            # Valid if moving forward or staying in place
-            return to_idx >= from_idx
-        except ValueError:
-            return False
+        # Valid if moving forward or staying in place
+        return _PHASE_INDEX[to_phase] >= _PHASE_INDEX[from_phase]
 
     def get_phase_progress(self) -> float:
         """Get overall progress through tutorial (0.0 to 1.0)."""
-        phase_order = list(TutorialPhase)
-        current_idx = phase_order.index(self.current_phase)
-        total_phases = len(phase_order) - 1  # Exclude COMPLETE
-
-        return current_idx / total_phases
+        total_phases = _PHASE_COUNT - 1  # Exclude COMPLETE
+        return _PHASE_INDEX[self.current_phase] / total_phases
 
 
 # =============================================================================
 # BASE PHASE HANDLER
 # =============================================================================
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PhaseAction:
-    """An action to perform in a tutorial phase."""
+    """
+    An action to perform in a tutorial phase.
+
+    Actions are shared, immutable templates; per-run completion lives on
+    the handler (PhaseHandler.actions_done). details is copied into a
+    read-only mapping so no consumer can mutate a shared template.
+    """
     action_type: str  # "talk_to", "click_object", "use_item", etc.
     target: str       # NPC name, object name, item name
-    details: Dict[str, Any] = field(default_factory=dict)
-    completed: bool = False
+    details: Mapping[str, Any] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        if not isinstance(self.details, MappingProxyType):
+            object.__setattr__(self, "details", MappingProxyType(dict(self.details)))
 
 
 class PhaseHandler(ABC):
@@ -326,12 +447,16 @@ class PhaseHandler(ABC):
     Base class for tutorial phase handlers.
 
     Each phase handler implements the logic for completing
-    a specific section of Tutorial Island.
+    a specific section of Tutorial Island. Subclasses list their steps
+    in _ACTION_TEMPLATE.
     """
 
+    _ACTION_TEMPLATE: Tuple[PhaseAction, ...] = ()
+
     def __init__(self):
         self.phase: TutorialPhase = TutorialPhase.CHARACTER_CREATION
-        self.actions: List[PhaseAction] = []
+        self.actions: Tuple[PhaseAction, ...] = ()
+        self.actions_done: List[bool] = []
         self.current_action_idx: int = 0
         self.completed: bool = False
 
@@ -340,24 +465,40 @@ class PhaseHandler(ABC):
         """Get the phase this handler manages."""
         pass
 
-    @abstractmethod
     def initialize(self, snapshot: Dict[str, Any]):
         """Initialize the phase handler with current state."""
-        pass
+        self.actions = self._ACTION_TEMPLATE
+        self.actions_done = [False] * len(self.actions)
 
-    @abstractmethod
-    def get_next_action(self, snapshot: Dict[str, Any]) -> Optional[PhaseAction]:
-        """Get the next action to perform."""
-        pass
+    def get_next_action(self, snapshot: Dict[str, Any], progress: Optional[int] = None) -> Optional[PhaseAction]:
+        """
+        Get the next action to perform.
 
-    @abstractmethod
-    def is_complete(self, snapshot: Dict[str, Any]) -> bool:
-        """Check if this phase is complete."""
-        pass
+        progress is varbit 281 as already read by the caller, if available.
+
+        Default: the first action from current_action_idx onward that is
+        not yet completed. Override for snapshot-driven skip logic.
+        """
+        actions = self.actions
+        done = self.actions_done
+        idx = self.current_action_idx
+        while idx < len(actions):
+            if not done[idx]:
+                self.current_action_idx = idx
+                return actions[idx]
+            idx += 1
+
+        self.current_action_idx = idx
+        return None
+
+    def is_complete(self, snapshot: Dict[str, Any], progress: Optional[int] = None) -> bool:
+        """Check if this phase is complete (varbit 281 reached the next phase)."""
+        return _tutorial_progress(snapshot, progress) >= _PHASE_COMPLETE_THRESHOLD[self.get_phase()]
 
     def mark_action_complete(self, action: PhaseAction):
-        """Mark an action as completed."""
-        action.completed = True
+        """Mark an action (the current one) as completed."""
+        if self.current_action_idx < len(self.actions_done):
+            self.actions_done[self.current_action_idx] = True
         self.current_action_idx += 1
 
 
@@ -376,40 +517,33 @@ class GielinorGuidePhase(PhaseHandler):
     4. Walk through door to Survival Expert area
     """
 
+    _ACTION_TEMPLATE = (
+        PhaseAction("talk_to", "Gielinor Guide", {"dialogue_option": 1}),
+        PhaseAction("open_tab", "options", {}),
+        PhaseAction("talk_to", "Gielinor Guide", {"dialogue_option": 1}),
+        PhaseAction("click_object", "Door", {"action": "open"}),
+    )
+
     def get_phase(self) -> TutorialPhase:
         return TutorialPhase.GIELINOR_GUIDE
 
-    def initialize(self, snapshot: Dict[str, Any]):
-        self.actions = [
-            PhaseAction("talk_to", "Gielinor Guide", {"dialogue_option": 1}),
-            PhaseAction("open_tab", "options", {}),
-            PhaseAction("talk_to", "Gielinor Guide", {"dialogue_option": 1}),
-            PhaseAction("click_object", "Door", {"action": "open"}),
-        ]
-
-    def get_next_action(self, snapshot: Dict[str, Any]) -> Optional[PhaseAction]:
-        if self.current_action_idx >= len(self.actions):
-            return None
-
-        action = self.actions[self.current_action_idx]
-
+    def get_next_action(self, snapshot: Dict[str, Any], progress: Optional[int] = None) -> Optional[PhaseAction]:
         # Check if current action is already done based on game state
-        runelite = snapshot.get("runelite_data", {})
-        progress = runelite.get("tutorial_progress", 0)
+        progress = _tutorial_progress(snapshot, progress)
 
-        # Adjust action based on progress
-        if action.action_type == "open_tab" and progress >= 7:
-            # Options tab already opened
-            action.completed = True
-            self.current_action_idx += 1
-            return self.get_next_action(snapshot)
+        while self.current_action_idx < len(self.actions):
+            action = self.actions[self.current_action_idx]
 
-        return action
+            # Adjust action based on progress
+            if action.action_type == "open_tab" and progress >= 7:
+                # Options tab already opened
+                self.actions_done[self.current_action_idx] = True
+                self.current_action_idx += 1
+                continue
 
-    def is_complete(self, snapshot: Dict[str, Any]) -> bool:
-        runelite = snapshot.get("runelite_data", {})
-        progress = runelite.get("tutorial_progress", 0)
-        return progress >= 20  # Moving to Survival Expert
+            return action
+
+        return None
 
 
 # =============================================================================
@@ -432,34 +566,33 @@ class SurvivalExpertPhase(PhaseHandler):
     9. Walk to next area
     """
 
+    _ACTION_TEMPLATE = (
+        PhaseAction("talk_to", "Survival Expert", {}),
+        PhaseAction("open_tab", "inventory", {}),
+        PhaseAction("click_object", "Fishing spot", {"action": "net"}),
+        PhaseAction("wait", "", {"condition": "inventory_has", "item": "raw shrimps"}),
+        PhaseAction("open_tab", "skills", {}),
+        PhaseAction("talk_to", "Survival Expert", {}),
+        PhaseAction("click_object", "Tree", {"action": "chop down"}),
+        PhaseAction("wait", "", {"condition": "inventory_has", "item": "logs"}),
+        PhaseAction("use_item", "Tinderbox", {"target_item": "Logs"}),
+        PhaseAction("wait", "", {"condition": "fire_lit"}),
+        PhaseAction("use_item", "Raw shrimps", {"target_object": "Fire"}),
+        PhaseAction("wait", "", {"condition": "inventory_has", "item": "shrimps"}),
+        PhaseAction("click_object", "Gate", {"action": "open"}),
+    )
+
     def get_phase(self) -> TutorialPhase:
         return TutorialPhase.SURVIVAL_EXPERT
 
-    def initialize(self, snapshot: Dict[str, Any]):
-        self.actions = [
-            PhaseAction("talk_to", "Survival Expert", {}),
-            PhaseAction("open_tab", "inventory", {}),
-            PhaseAction("click_object", "Fishing spot", {"action": "net"}),
-            PhaseAction("wait", "", {"condition": "inventory_has", "item": "raw shrimps"}),
-            PhaseAction("open_tab", "skills", {}),
-            PhaseAction("talk_to", "Survival Expert", {}),
-            PhaseAction("click_object", "Tree", {"action": "chop down"}),
-            PhaseAction("wait", "", {"condition": "inventory_has", "item": "logs"}),
-            PhaseAction("use_item", "Tinderbox", {"target_item": "Logs"}),
-            PhaseAction("wait", "", {"condition": "fire_lit"}),
-            PhaseAction("use_item", "Raw shrimps", {"target_object": "Fire"}),
-            PhaseAction("wait", "", {"condition": "inventory_has", "item": "shrimps"}),
-            PhaseAction("click_object", "Gate", {"action": "open"}),
-        ]
-
-    def get_next_action(self, snapshot: Dict[str, Any]) -> Optional[PhaseAction]:
+    def get_next_action(self, snapshot: Dict[str, Any], progress: Optional[int] = None) -> Optional[PhaseAction]:
         if self.current_action_idx >= len(self.actions):
             return None
 
         action = self.actions[self.current_action_idx]
 
         # Check inventory for progress
-        runelite = snapshot.get("runelite_data", {})
+        runelite = snapshot.get("runelite_data", _EMPTY)
         inventory_count = runelite.get("inventory_count", 0)
 
         # Handle wait conditions
@@ -472,11 +605,6 @@ class SurvivalExpertPhase(PhaseHandler):
 
         return action
 
-    def is_complete(self, snapshot: Dict[str, Any]) -> bool:
-        runelite = snapshot.get("runelite_data", {})
-        progress = runelite.get("tutorial_progress", 0)
-        return progress >= 70  # Moving to Master Chef
-
 
 # =============================================================================
 # T19: MASTER CHEF PHASE
@@ -493,29 +621,18 @@ class MasterChefPhase(PhaseHandler):
     4. Walk to next area
     """
 
+    _ACTION_TEMPLATE = (
+        PhaseAction("talk_to", "Master Chef", {}),
+        PhaseAction("use_item", "Pot of flour", {"target_item": "Bucket of water"}),
+        PhaseAction("use_item", "Bread dough", {"target_object": "Range"}),
+        PhaseAction("wait", "", {"condition": "inventory_has", "item": "bread"}),
+        PhaseAction("walk_to", "Music tab door", {}),
+        PhaseAction("click_object", "Door", {"action": "open"}),
+    )
+
     def get_phase(self) -> TutorialPhase:
         return TutorialPhase.MASTER_CHEF
 
-    def initialize(self, snapshot: Dict[str, Any]):
-        self.actions = [
-            PhaseAction("talk_to", "Master Chef", {}),
-            PhaseAction("use_item", "Pot of flour", {"target_item": "Bucket of water"}),
-            PhaseAction("use_item", "Bread dough", {"target_object": "Range"}),
-            PhaseAction("wait", "", {"condition": "inventory_has", "item": "bread"}),
-            PhaseAction("walk_to", "Music tab door", {}),
-            PhaseAction("click_object", "Door", {"action": "open"}),
-        ]
-
-    def get_next_action(self, snapshot: Dict[str, Any]) -> Optional[PhaseAction]:
-        if self.current_action_idx >= len(self.actions):
-            return None
-        return self.actions[self.current_action_idx]
-
-    def is_complete(self, snapshot: Dict[str, Any]) -> bool:
-        runelite = snapshot.get("runelite_data", {})
-        progress = runelite.get("tutorial_progress", 0)
-        return progress >= 120
-
 
 # =============================================================================
 # T20: QUEST GUIDE PHASE
@@ -532,27 +649,16 @@ class QuestGuidePhase(PhaseHandler):
     4. Walk to mining area
     """
 
+    _ACTION_TEMPLATE = (
+        PhaseAction("talk_to", "Quest Guide", {}),
+        PhaseAction("open_tab", "quest", {}),
+        PhaseAction("talk_to", "Quest Guide", {}),
+        PhaseAction("click_object", "Ladder", {"action": "climb-down"}),
+    )
+
     def get_phase(self) -> TutorialPhase:
         return TutorialPhase.QUEST_GUIDE
 
-    def initialize(self, snapshot: Dict[str, Any]):
-        self.actions = [
-            PhaseAction("talk_to", "Quest Guide", {}),
-            PhaseAction("open_tab", "quest", {}),
-            PhaseAction("talk_to", "Quest Guide", {}),
-            PhaseAction("click_object", "Ladder", {"action": "climb-down"}),
-        ]
-
-    def get_next_action(self, snapshot: Dict[str, Any]) -> Optional[PhaseAction]:
-        if self.current_action_idx >= len(self.actions):
-            return None
-        return self.actions[self.current_action_idx]
-
-    def is_complete(self, snapshot: Dict[str, Any]) -> bool:
-        runelite = snapshot.get("runelite_data", {})
-        progress = runelite.get("tutorial_progress", 0)
-        return progress >= 170
-
 
 # =============================================================================
 # T21: MINING INSTRUCTOR PHASE
@@ -572,35 +678,24 @@ class MiningInstructorPhase(PhaseHandler):
     7. Walk to next area
     """
 
+    _ACTION_TEMPLATE = (
+        PhaseAction("talk_to", "Mining Instructor", {}),
+        PhaseAction("click_object", "Tin rocks", {"action": "mine"}),
+        PhaseAction("wait", "", {"condition": "inventory_has", "item": "tin ore"}),
+        PhaseAction("click_object", "Copper rocks", {"action": "mine"}),
+        PhaseAction("wait", "", {"condition": "inventory_has", "item": "copper ore"}),
+        PhaseAction("click_object", "Furnace", {"action": "smelt"}),
+        PhaseAction("wait", "", {"condition": "inventory_has", "item": "bronze bar"}),
+        PhaseAction("talk_to", "Mining Instructor", {}),
+        PhaseAction("click_object", "Anvil", {"action": "smith"}),
+        PhaseAction("click_interface", "Bronze dagger", {}),
+        PhaseAction("wait", "", {"condition": "inventory_has", "item": "bronze dagger"}),
+        PhaseAction("click_object", "Gate", {"action": "open"}),
+    )
+
     def get_phase(self) -> TutorialPhase:
         return TutorialPhase.MINING_INSTRUCTOR
 
-    def initialize(self, snapshot: Dict[str, Any]):
-        self.actions = [
-            PhaseAction("talk_to", "Mining Instructor", {}),
-            PhaseAction("click_object", "Tin rocks", {"action": "mine"}),
-            PhaseAction("wait", "", {"condition": "inventory_has", "item": "tin ore"}),
-            PhaseAction("click_object", "Copper rocks", {"action": "mine"}),
-            PhaseAction("wait", "", {"condition": "inventory_has", "item": "copper ore"}),
-            PhaseAction("click_object", "Furnace", {"action": "smelt"}),
-            PhaseAction("wait", "", {"condition": "inventory_has", "item": "bronze bar"}),
-            PhaseAction("talk_to", "Mining Instructor", {}),
-            PhaseAction("click_object", "Anvil", {"action": "smith"}),
-            PhaseAction("click_interface", "Bronze dagger", {}),
-            PhaseAction("wait", "", {"condition": "inventory_has", "item": "bronze dagger"}),
-            PhaseAction("click_object", "Gate", {"action": "open"}),
-        ]
-
-    def get_next_action(self, snapshot: Dict[str, Any]) -> Optional[PhaseAction]:
-        if self.current_action_idx >= len(self.actions):
-            return None
-        return self.actions[self.current_action_idx]
-
-    def is_complete(self, snapshot: Dict[str, Any]) -> bool:
-        runelite = snapshot.get("runelite_data", {})
-        progress = runelite.get("tutorial_progress", 0)
-        return progress >= 300
-
 
 # =============================================================================
 # T22: COMBAT INSTRUCTOR PHASE
@@ -625,41 +720,30 @@ class CombatInstructorPhase(PhaseHandler):
     12. Walk to next area
     """
 
+    _ACTION_TEMPLATE = (
+        PhaseAction("talk_to", "Combat Instructor", {}),
+        PhaseAction("open_tab", "equipment", {}),
+        PhaseAction("click_interface", "Equipment stats", {}),
+        PhaseAction("equip", "Bronze dagger", {}),
+        PhaseAction("talk_to", "Combat Instructor", {}),
+        PhaseAction("equip", "Bronze sword", {}),
+        PhaseAction("equip", "Wooden shield", {}),
+        PhaseAction("open_tab", "combat", {}),
+        PhaseAction("click_object", "Gate", {"action": "open"}),
+        PhaseAction("attack", "Giant rat", {}),
+        PhaseAction("wait", "", {"condition": "combat_complete"}),
+        PhaseAction("click_object", "Gate", {"action": "open"}),
+        PhaseAction("talk_to", "Combat Instructor", {}),
+        PhaseAction("equip", "Shortbow", {}),
+        PhaseAction("equip", "Bronze arrow", {}),
+        PhaseAction("attack", "Giant rat", {}),
+        PhaseAction("wait", "", {"condition": "combat_complete"}),
+        PhaseAction("click_object", "Ladder", {"action": "climb-up"}),
+    )
+
     def get_phase(self) -> TutorialPhase:
         return TutorialPhase.COMBAT_INSTRUCTOR
 
-    def initialize(self, snapshot: Dict[str, Any]):
-        self.actions = [
-            PhaseAction("talk_to", "Combat Instructor", {}),
-            PhaseAction("open_tab", "equipment", {}),
-            PhaseAction("click_interface", "Equipment stats", {}),
-            PhaseAction("equip", "Bronze dagger", {}),
-            PhaseAction("talk_to", "Combat Instructor", {}),
-            PhaseAction("equip", "Bronze sword", {}),
-            PhaseAction("equip", "Wooden shield", {}),
-            PhaseAction("open_tab", "combat", {}),
-            PhaseAction("click_object", "Gate", {"action": "open"}),
-            PhaseAction("attack", "Giant rat", {}),
-            PhaseAction("wait", "", {"condition": "combat_complete"}),
-            PhaseAction("click_object", "Gate", {"action": "open"}),
-            PhaseAction("talk_to", "Combat Instructor", {}),
-            PhaseAction("equip", "Shortbow", {}),
-            PhaseAction("equip", "Bronze arrow", {}),
-            PhaseAction("attack", "Giant rat", {}),
-            PhaseAction("wait", "", {"condition": "combat_complete"}),
-            PhaseAction("click_object", "Ladder", {"action": "climb-up"}),
-        ]
-
-    def get_next_action(self, snapshot: Dict[str, Any]) -> Optional[PhaseAction]:
-        if self.current_action_idx >= len(self.actions):
-            return None
-        return self.actions[self.current_action_idx]
-
-    def is_complete(self, snapshot: Dict[str, Any]) -> bool:
-        runelite = snapshot.get("runelite_data", {})
-        progress = runelite.get("tutorial_progress", 0)
-        return progress >= 510
-
 
 # =============================================================================
 # T23: FINANCIAL ADVISOR PHASE
@@ -679,29 +763,18 @@ class FinancialAdvisorPhase(PhaseHandler):
     7. Walk to next area
     """
 
+    _ACTION_TEMPLATE = (
+        PhaseAction("click_object", "Bank booth", {"action": "use"}),
+        PhaseAction("close_interface", "Bank", {}),
+        PhaseAction("click_object", "Poll booth", {"action": "use"}),
+        PhaseAction("close_interface", "Poll", {}),
+        PhaseAction("talk_to", "Financial Advisor", {}),
+        PhaseAction("click_object", "Door", {"action": "open"}),
+    )
+
     def get_phase(self) -> TutorialPhase:
         return TutorialPhase.FINANCIAL_ADVISOR
 
-    def initialize(self, snapshot: Dict[str, Any]):
-        self.actions = [
-            PhaseAction("click_object", "Bank booth", {"action": "use"}),
-            PhaseAction("close_interface", "Bank", {}),
-            PhaseAction("click_object", "Poll booth", {"action": "use"}),
-            PhaseAction("close_interface", "Poll", {}),
-            PhaseAction("talk_to", "Financial Advisor", {}),
-            PhaseAction("click_object", "Door", {"action": "open"}),
-        ]
-
-    def get_next_action(self, snapshot: Dict[str, Any]) -> Optional[PhaseAction]:
-        if self.current_action_idx >= len(self.actions):
-            return None
-        return self.actions[self.current_action_idx]
-
-    def is_complete(self, snapshot: Dict[str, Any]) -> bool:
-        runelite = snapshot.get("runelite_data", {})
-        progress = runelite.get("tutorial_progress", 0)
-        return progress >= 525
-
 
 # =============================================================================
 # T24: BROTHER BRACE PHASE
@@ -720,29 +793,18 @@ class BrotherBracePhase(PhaseHandler):
     6. Walk to next area
     """
 
+    _ACTION_TEMPLATE = (
+        PhaseAction("talk_to", "Brother Brace", {}),
+        PhaseAction("open_tab", "prayer", {}),
+        PhaseAction("talk_to", "Brother Brace", {}),
+        PhaseAction("open_tab", "friends", {}),
+        PhaseAction("talk_to", "Brother Brace", {}),
+        PhaseAction("click_object", "Door", {"action": "open"}),
+    )
+
     def get_phase(self) -> TutorialPhase:
         return TutorialPhase.BROTHER_BRACE
 
-    def initialize(self, snapshot: Dict[str, Any]):
-        self.actions = [
-            PhaseAction("talk_to", "Brother Brace", {}),
-            PhaseAction("open_tab", "prayer", {}),
-            PhaseAction("talk_to", "Brother Brace", {}),
-            PhaseAction("open_tab", "friends", {}),
-            PhaseAction("talk_to", "Brother Brace", {}),
-            PhaseAction("click_object", "Door", {"action": "open"}),
-        ]
-
-    def get_next_action(self, snapshot: Dict[str, Any]) -> Optional[PhaseAction]:
-        if self.current_action_idx >= len(self.actions):
-            return None
-        return self.actions[self.current_action_idx]
-
-    def is_complete(self, snapshot: Dict[str, Any]) -> bool:
-        runelite = snapshot.get("runelite_data", {})
-        progress = runelite.get("tutorial_progress", 0)
-        return progress >= 610
-
 
 # =============================================================================
 # T25: MAGIC INSTRUCTOR PHASE
@@ -761,30 +823,19 @@ class MagicInstructorPhase(PhaseHandler):
     6. Choose mainland destination
     """
 
+    _ACTION_TEMPLATE = (
+        PhaseAction("talk_to", "Magic Instructor", {}),
+        PhaseAction("open_tab", "magic", {}),
+        PhaseAction("talk_to", "Magic Instructor", {}),
+        PhaseAction("cast_spell", "Wind Strike", {"target": "Chicken"}),
+        PhaseAction("wait", "", {"condition": "combat_complete"}),
+        PhaseAction("talk_to", "Magic Instructor", {}),
+        PhaseAction("dialogue_option", "Yes", {}),
+    )
+
     def get_phase(self) -> TutorialPhase:
         return TutorialPhase.MAGIC_INSTRUCTOR
 
-    def initialize(self, snapshot: Dict[str, Any]):
-        self.actions = [
-            PhaseAction("talk_to", "Magic Instructor", {}),
-            PhaseAction("open_tab", "magic", {}),
-            PhaseAction("talk_to", "Magic Instructor", {}),
-            PhaseAction("cast_spell", "Wind Strike", {"target": "Chicken"}),
-            PhaseAction("wait", "", {"condition": "combat_complete"}),
-            PhaseAction("talk_to", "Magic Instructor", {}),
-            PhaseAction("dialogue_option", "Yes", {}),
-        ]
-
-    def get_next_action(self, snapshot: Dict[str, Any]) -> Optional[PhaseAction]:
-        if self.current_action_idx >= len(self.actions):
-            return None
-        return self.actions[self.current_action_idx]
-
-    def is_complete(self, snapshot: Dict[str, Any]) -> bool:
-        runelite = snapshot.get("runelite_data", {})
-        progress = runelite.get("tutorial_progress", 0)
-        return progress >= 1000
-
 
 # =============================================================================
 # TUTORIAL ORCHESTRATOR
@@ -799,18 +850,21 @@ class TutorialOrchestrator:
 
     def __init__(self):
         self.phase_verifier = PhaseVerifier()
-        self.phase_handlers: Dict[TutorialPhase, PhaseHandler] = {
-            TutorialPhase.GIELINOR_GUIDE: GielinorGuidePhase(),
-            TutorialPhase.SURVIVAL_EXPERT: SurvivalExpertPhase(),
-            TutorialPhase.MASTER_CHEF: MasterChefPhase(),
-            TutorialPhase.QUEST_GUIDE: QuestGuidePhase(),
-            TutorialPhase.MINING_INSTRUCTOR: MiningInstructorPhase(),
-            TutorialPhase.COMBAT_INSTRUCTOR: CombatInstructorPhase(),
-            TutorialPhase.FINANCIAL_ADVISOR: FinancialAdvisorPhase(),
-            TutorialPhase.BROTHER_BRACE: BrotherBracePhase(),
-            TutorialPhase.MAGIC_INSTRUCTOR: MagicInstructorPhase(),
+        # Handlers are created the first time their phase becomes active
+        self._phase_handler_factories: Dict[TutorialPhase, Type[PhaseHandler]] = {
+            TutorialPhase.GIELINOR_GUIDE: GielinorGuidePhase,
+            TutorialPhase.SURVIVAL_EXPERT: SurvivalExpertPhase,
+            TutorialPhase.MASTER_CHEF: MasterChefPhase,
+            TutorialPhase.QUEST_GUIDE: QuestGuidePhase,
+            TutorialPhase.MINING_INSTRUCTOR: MiningInstructorPhase,
+            TutorialPhase.COMBAT_INSTRUCTOR: CombatInstructorPhase,
+            TutorialPhase.FINANCIAL_ADVISOR: FinancialAdvisorPhase,
+            TutorialPhase.BROTHER_BRACE: BrotherBracePhase,
+            TutorialPhase.MAGIC_INSTRUCTOR: MagicInstructorPhase,
         }
+        self.phase_handlers: Dict[TutorialPhase, PhaseHandler] = {}
         self.current_handler: Optional[PhaseHandler] = None
+        self._active_phase: Optional[TutorialPhase] = None
         self.started: bool = False
 
     def start(self, snapshot: Dict[str, Any]):
@@ -828,33 +882,49 @@ class TutorialOrchestrator:
         if not self.started:
             return None
 
+        # Read varbit 281 once and hand it to the verifier and handler
+        runelite = snapshot.get("runelite_data") or _EMPTY
+        progress = runelite.get("tutorial_progress", 0)
+
         # Check for phase transitions
-        transition = self.phase_verifier.update(snapshot)
+        transition = self.phase_verifier.update(snapshot, progress)
         if transition:
             self._update_handler(snapshot)
 
         # Get next action from current handler
         if self.current_handler:
-            action = self.current_handler.get_next_action(snapshot)
+            action = self.current_handler.get_next_action(snapshot, progress)
             if action:
                 return action
 
-            # Check if phase complete
-            if self.current_handler.is_complete(snapshot):
+            # Check if phase complete; only re-run once a new phase is active
+            if self.current_handler.is_complete(snapshot, progress):
+                previous_handler = self.current_handler
                 self._update_handler(snapshot)
-                return self.update(snapshot)
+                if self.current_handler is not previous_handler:
+                    return self.update(snapshot)
 
         return None
 
     def _update_handler(self, snapshot: Dict[str, Any]):
-        """Update the current phase handler."""
+        """Switch to the handler for the verifier's phase, if it changed."""
         current_phase = self.phase_verifier.current_phase
-
-        if current_phase in self.phase_handlers:
-            self.current_handler = self.phase_handlers[current_phase]
-            self.current_handler.initialize(snapshot)
-        else:
-            self.current_handler = None
+        if current_phase is self._active_phase:
+            # Same phase: keep the handler's actions and progress
+            return
+        self._active_phase = current_phase
+
+        handler = self.phase_handlers.get(current_phase)
+        if handler is None:
+            factory = self._phase_handler_factories.get(current_phase)
+            if factory is None:
+                self.current_handler = None
+                return
+            handler = factory()
+            self.phase_handlers[current_phase] = handler
+
+        self.current_handler = handler
+        self.current_handler.initialize(snapshot)
 
     def is_complete(self) -> bool:
         """Check if tutorial is complete."""
@@ -865,7 +935,7 @@ class TutorialOrchestrator:
         return {
             "current_phase": self.phase_verifier.current_phase.value,
             "progress_percent": self.phase_verifier.get_phase_progress() * 100,
-            "transitions": len(self.phase_verifier.transitions),
+            "transitions": self.phase_verifier.transition_count,
             "is_complete": self.is_complete(),
         }
 
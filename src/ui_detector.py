@@ -1,41 +1,154 @@
 from __future__ import annotations
 
+import functools
+import logging
+import sys
 from dataclasses import dataclass
-from typing import Any, Dict, List, Protocol
+from typing import (
+    TYPE_CHECKING, Any, Callable, Dict, Final, Iterable, Mapping, NamedTuple, Optional, Protocol, Sequence, Tuple,
+    Union,
+)
 
+if TYPE_CHECKING:
+    import numpy as np
 
-@dataclass(frozen=True)
+logger = logging.getLogger(__name__)
+
+# (x, y, width, height)
+Bounds = Tuple[int, int, int, int]
+
+
+@dataclass(frozen=True, slots=True)
 class UiElement:
     element_id: str
     element_type: str
     label: str
     state: str
-    bounds: Dict[str, int]
+    bounds: Bounds
+
+    def __post_init__(self) -> None:
+        # Small fixed vocabularies: interned so equality hits the identity shortcut
+        object.__setattr__(self, "element_type", sys.intern(self.element_type))
+        object.__setattr__(self, "state", sys.intern(self.state))
+
+
+@dataclass(frozen=True, slots=True)
+class UiElementBatch:
+    """
+    Column-wise (SoA) view of many UiElements from one frame.
+
+    types, states and bounds are NumPy arrays when NumPy is installed, so
+    filters like ``batch.states == "occluded"`` run vectorized; otherwise
+    every column is a plain tuple.
+    """
+    ids: Tuple[str, ...]
+    types: Union[Tuple[str, ...], np.ndarray]
+    labels: Tuple[str, ...]
+    states: Union[Tuple[str, ...], np.ndarray]
+    bounds: Union[Tuple[Bounds, ...], np.ndarray]  # (N, 4) int32 when NumPy is available
+
+    @classmethod
+    def from_elements(cls, elements: Iterable[UiElement]) -> "UiElementBatch":
+        elements = tuple(elements)
+        ids = tuple(e.element_id for e in elements)
+        types = tuple(e.element_type for e in elements)
+        labels = tuple(e.label for e in elements)
+        states = tuple(e.state for e in elements)
+        bounds = tuple(e.bounds for e in elements)
+        try:
+            import numpy as np
+        except ImportError:
+            return cls(ids, types, labels, states, bounds)
+        return cls(
+            ids,
+            np.array(types, dtype=str),
+            labels,
+            np.array(states, dtype=str),
+            np.array(bounds, dtype=np.int32).reshape(-1, 4),
+        )
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+
+class Regions(NamedTuple):
+    """Detector input regions (see data/ui_detector_regions.json); each is a bounds dict or None."""
+    tabs: Optional[Dict[str, Any]] = None
+    inventory: Optional[Dict[str, Any]] = None
+    minimap: Optional[Dict[str, Any]] = None
+
+    @classmethod
+    def from_mapping(cls, regions: Mapping[str, Any]) -> "Regions":
+        unknown = regions.keys() - _REGION_FIELDS
+        if unknown:
+            _warn_unknown_regions(frozenset(unknown))
+        return cls(*(regions.get(name) for name in cls._fields))
+
+
+_REGION_FIELDS = frozenset(Regions._fields)
+
+
+@functools.lru_cache(maxsize=32)
+def _warn_unknown_regions(names: frozenset) -> None:
+    # Cached so a misconfigured region is reported once, not every frame
+    logger.warning(
+        f"Ignoring unknown UI detector regions {sorted(names)}; "
+        f"add them as fields on Regions (known: {list(Regions._fields)})"
+    )
+
+
+def _as_regions(regions: Union[Regions, Mapping[str, Any]]) -> Regions:
+    return regions if isinstance(regions, Regions) else Regions.from_mapping(regions)
+
+
+# Shared result for "nothing detected"; callers only iterate detector output
+_NO_ELEMENTS: Tuple[UiElement, ...] = ()
 
 
 class UiDetector(Protocol):
-    def detect(self, regions: Dict[str, Any]) -> List[UiElement]:
+    """Typing-only interface; not runtime_checkable, so no structural isinstance checks."""
+
+    def detect(self, regions: Regions) -> Sequence[UiElement]:
         ...
 
 
 class NoopUiDetector:
-    def detect(self, regions: Dict[str, Any]) -> List[UiElement]:
-        return []
+    __slots__ = ()
+
+    def detect(self, regions: Regions) -> Sequence[UiElement]:
+        return _NO_ELEMENTS
 
 
-_DETECTORS: Dict[str, UiDetector] = {
+_DETECTORS: Final[Dict[str, UiDetector]] = {
     "noop": NoopUiDetector(),
 }
 
 
 def register_detector(name: str, detector: UiDetector) -> None:
     _DETECTORS[name] = detector
+    _resolve_detect.cache_clear()
 
 
 def get_detector(name: str) -> UiDetector:
     return _DETECTORS.get(name, _DETECTORS["noop"])
 
 
-def detect_ui(regions: Dict[str, Any], detector_name: str = "noop") -> List[UiElement]:
+@functools.lru_cache(maxsize=16)
+def _resolve_detect(name: str) -> Callable[[Regions], Sequence[UiElement]]:
+    # Bound detect method per name; cleared whenever the registry changes
+    return get_detector(name).detect
+
+
+def detect_ui(regions: Union[Regions, Mapping[str, Any]], detector_name: str = "noop") -> Sequence[UiElement]:
+    """Run a detector; plain region dicts (e.g. loaded JSON) are adapted to Regions."""
+    return _resolve_detect(detector_name)(_as_regions(regions))
+
+
+def detect_ui_batch(regions: Union[Regions, Mapping[str, Any]], detector_name: str = "noop") -> UiElementBatch:
+    """Like detect_ui, but columnar; detectors may supply detect_batch natively."""
+    regions = _as_regions(regions)
     detector = get_detector(detector_name)
-    return detector.detect(regions)
+    detect_batch = getattr(detector, "detect_batch", None)
+    if detect_batch is not None:
+        return detect_batch(regions)
+    return UiElementBatch.from_elements(detector.detect(regions))
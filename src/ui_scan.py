@@ -1,21 +1,88 @@
 from __future__ import annotations
 
-from typing import Dict, List, Tuple
+import functools
+from typing import Any, Dict, List, Tuple
 
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
 
-def build_scan_points(bounds: Dict[str, int], steps: int = 5) -> List[Tuple[int, int]]:
+# Below this many steps NumPy's fixed call overhead outweighs the loop
+_VECTORIZE_MIN_STEPS = 8
+
+# Vertical offset (fraction of height) for even / odd scan steps
+_ROW_PARITY = (0.5, 0.25)
+
+# Numba kernel, compiled on the first dense scan; False once numba is known missing
+_scan_kernel: Any = None
+
+
+def build_scan_points(bounds: Dict[str, int], steps: int = 5) -> Tuple[Tuple[int, int], ...]:
+    """
+    Scan points across a region. Static regions (inventory, minimap) keep
+    the same geometry every frame, so results are shared per (bounds, steps);
+    the returned tuple must not be treated as a caller-owned buffer.
+    """
     x = bounds.get("x", 0)
     y = bounds.get("y", 0)
     width = max(1, bounds.get("width", 1))
     height = max(1, bounds.get("height", 1))
+    return _cached_scan_points(x, y, width, height, steps)
+
+
+@functools.lru_cache(maxsize=256)
+def _cached_scan_points(x: int, y: int, width: int, height: int, steps: int) -> Tuple[Tuple[int, int], ...]:
+    if steps > _VECTORIZE_MIN_STEPS and HAS_NUMPY:
+        kernel = _load_scan_kernel()
+        if kernel:
+            out = np.empty((steps, 2), np.int32)
+            kernel(x, y, width, height, steps, out)
+            return tuple((col, row) for col, row in out.tolist())
+        return tuple(_build_scan_points_np(x, y, width, height, steps))
 
+    # Only two distinct rows exist; pick one by step parity
+    rows = (y + int(height * _ROW_PARITY[0]), y + int(height * _ROW_PARITY[1]))
+    denom = max(1, steps - 1)
     points: List[Tuple[int, int]] = []
     for idx in range(steps):
-        t = idx / max(1, steps - 1)
-        px = x + int(width * t)
-        py = y + int(height * (0.5 if idx % 2 == 0 else 0.25))
-        points.append((px, py))
-    return points
+        points.append((x + int(width * (idx / denom)), rows[idx & 1]))
+    return tuple(points)
+
+
+def _build_scan_points_np(x: int, y: int, width: int, height: int, steps: int) -> List[Tuple[int, int]]:
+    idx = np.arange(steps)
+    # Same division as the scalar loop so truncation matches point-for-point
+    t = idx / max(1, steps - 1)
+    px = x + (width * t).astype(np.int32)
+    rows = np.array((y + int(height * _ROW_PARITY[0]), y + int(height * _ROW_PARITY[1])), np.int32)
+    py = rows[idx & 1]
+    return [(col, row) for col, row in np.stack([px, py], axis=1).tolist()]
+
+
+def _load_scan_kernel() -> Any:
+    """
+    Import numba and compile the kernel on first use, so importing this
+    module (e.g. for scan_panel) never pays for numba.
+
+    Eager signature plus cache=True: one compile per process at most, and a
+    disk-cache load afterwards. No fastmath: it would let LLVM swap the
+    division for a reciprocal and shift truncated points.
+    """
+    global _scan_kernel
+    if _scan_kernel is None:
+        try:
+            from numba import njit
+        except ImportError:
+            _scan_kernel = False
+        else:
+            # Kernel lives in a module mypyc never compiles, so njit gets a real function
+            from src.ui_scan_kernels import scan_points_kernel
+            _scan_kernel = njit("void(int32, int32, int32, int32, int32, int32[:, :])", cache=True)(
+                scan_points_kernel
+            )
+    return _scan_kernel
 
 
 def scan_panel(bounds: Dict[str, int], rows: int = 2, cols: int = 3) -> List[Tuple[int, int]]:
@@ -0,0 +1,16 @@
+"""
+Numba kernels for ui_scan.
+
+Kept out of ui_scan.py so that module can be mypyc-compiled
+(scripts/build_mypyc.bat): numba needs real Python functions with
+__code__, which mypyc-compiled functions are not. Do not add this file
+to the mypyc build.
+"""
+
+
+def scan_points_kernel(x, y, width, height, steps, out):
+    denom = max(1, steps - 1)
+    rows = (y + int(height * 0.5), y + int(height * 0.25))
+    for idx in range(steps):
+        out[idx, 0] = x + int(width * (idx / denom))
+        out[idx, 1] = rows[idx & 1]
@@ -1,21 +1,106 @@
 from __future__ import annotations
 
-from typing import Iterable, Optional
+import functools
+import hashlib
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
 
 from src.ocr import OcrEntry
 
-KNOWN_CURSOR_STATES = {"default", "interact", "attack", "use", "talk", "walk", "unknown"}
+KNOWN_CURSOR_STATES = frozenset({"default", "interact", "attack", "use", "talk", "walk", "unknown"})
+
+# Normalized hint -> canonical (interned literal) state string
+_CURSOR_LUT: Dict[str, str] = {state: state for state in sorted(KNOWN_CURSOR_STATES)}
+
+_HOVER_CACHE_SIZE = 256
+_hover_text_cache: "OrderedDict[Tuple[bytes, str], str]" = OrderedDict()
+
+
+@functools.lru_cache(maxsize=128)
+def _normalize_cursor_hint(cursor_hint: str) -> str:
+    hint = cursor_hint
+    if not hint.islower() or hint[0].isspace() or hint[-1].isspace():
+        hint = hint.strip().lower()
+    return _CURSOR_LUT.get(hint, "unknown")
 
 
 def extract_cursor_state(cursor_hint: Optional[str]) -> str:
+    # None/empty short-circuit so they never occupy cache slots
     if not cursor_hint:
         return "unknown"
-    hint = cursor_hint.strip().lower()
-    return hint if hint in KNOWN_CURSOR_STATES else "unknown"
+    # Already-normalized hints (the common case): one dict probe, no copy,
+    # and the canonical string comes back rather than the caller's
+    state = _CURSOR_LUT.get(cursor_hint)
+    if state is not None:
+        return state
+    return _normalize_cursor_hint(cursor_hint)
+
+
+def index_by_region(entries: Iterable[OcrEntry]) -> Dict[str, List[OcrEntry]]:
+    """Group OCR entries by region in one pass, preserving their order."""
+    index: Dict[str, List[OcrEntry]] = {}
+    for entry in entries:
+        bucket = index.get(entry.region)
+        if bucket is None:
+            index[entry.region] = [entry]
+        else:
+            bucket.append(entry)
+    return index
+
+
+def extract_hover_text_indexed(index: Mapping[str, Sequence[OcrEntry]], region_name: str = "hover") -> str:
+    return next((entry.text for entry in index.get(region_name, ()) if entry.text), "")
 
 
-def extract_hover_text(entries: Iterable[OcrEntry], region_name: str = "hover") -> str:
+def extract_region_texts(entries: Iterable[OcrEntry], region_names: Sequence[str]) -> Dict[str, str]:
+    """
+    First non-empty text for each requested region, in a single pass over
+    entries; stops as soon as every region has been found.
+    """
+    texts = dict.fromkeys(region_names, "")
+    pending = set(texts)
+    for entry in entries:
+        if entry.region in pending and entry.text:
+            texts[entry.region] = entry.text
+            pending.discard(entry.region)
+            if not pending:
+                break
+    return texts
+
+
+def hash_region(image: Any) -> bytes:
+    """Cheap content key for a region crop (PIL image or raw bytes)."""
+    data = image if isinstance(image, (bytes, bytearray, memoryview)) else image.tobytes()
+    return hashlib.blake2b(data, digest_size=8).digest()
+
+
+def extract_hover_text(
+    entries: Iterable[OcrEntry],
+    region_name: str = "hover",
+    frame_hash: Optional[bytes] = None,
+) -> str:
+    """
+    Linear-scan lookup kept for single-region callers; when reading several
+    regions from the same frame, build index_by_region() once instead.
+
+    Pass frame_hash (see hash_region) to reuse the text found for identical
+    region pixels without walking entries again.
+    """
+    if frame_hash is not None:
+        key = (frame_hash, region_name)
+        cached = _hover_text_cache.get(key)
+        if cached is not None:
+            _hover_text_cache.move_to_end(key)
+            return cached
+
+    text = ""
     for entry in entries:
         if entry.region == region_name and entry.text:
-            return entry.text
-    return ""
+            text = entry.text
+            break
+
+    if frame_hash is not None:
+        _hover_text_cache[key] = text
+        if len(_hover_text_cache) > _HOVER_CACHE_SIZE:
+            _hover_text_cache.popitem(last=False)
+    return text